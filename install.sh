@@ -5,7 +5,7 @@ set -euo pipefail
 # Smart installer for Universal AI Context Awareness System
 
 VERSION="2.2.0"
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]:-$0}")" && pwd)"
 
 # Colors for output
 RED='\033[0;31m'
@@ -39,25 +39,116 @@ print_info() {
     echo -e "${BLUE}ℹ️  $1${NC}"
 }
 
-# Detect project type
-detect_project_type() {
+# Marker files that identify a (sub-)project stack
+PROJECT_MARKERS=(package.json requirements.txt setup.py pyproject.toml Cargo.toml go.mod pom.xml build.gradle composer.json)
+
+# Map a marker file name to its stack
+marker_stack() {
+    case "$1" in
+        package.json) echo "Node.js/JavaScript" ;;
+        requirements.txt|setup.py|pyproject.toml) echo "Python" ;;
+        Cargo.toml) echo "Rust" ;;
+        go.mod) echo "Go" ;;
+        pom.xml|build.gradle) echo "Java" ;;
+        composer.json) echo "PHP" ;;
+    esac
+}
+
+# Print marker file paths relative to the project, NUL-delimited (single tree walk)
+list_marker_files() {
     local project_path="$1"
+    local pathspecs=() find_names=() marker submodule
 
-    if [ -f "$project_path/package.json" ]; then
-        echo "Node.js/JavaScript"
-    elif [ -f "$project_path/requirements.txt" ] || [ -f "$project_path/setup.py" ]; then
-        echo "Python"
-    elif [ -f "$project_path/Cargo.toml" ]; then
-        echo "Rust"
-    elif [ -f "$project_path/go.mod" ]; then
-        echo "Go"
-    elif [ -f "$project_path/pom.xml" ] || [ -f "$project_path/build.gradle" ]; then
-        echo "Java"
-    elif [ -f "$project_path/composer.json" ]; then
-        echo "PHP"
+    for marker in "${PROJECT_MARKERS[@]}"; do
+        pathspecs+=(":(glob)**/$marker")
+        find_names+=(${find_names[@]+-o} -name "$marker")
+    done
+
+    # Inside a git work tree: honour .gitignore (skips node_modules, venvs, build output)
+    if git -C "$project_path" rev-parse --is-inside-work-tree >/dev/null 2>&1; then
+        git -C "$project_path" -c core.quotePath=false ls-files -z --cached --others --exclude-standard \
+            -- "${pathspecs[@]}" 2>/dev/null || true
+
+        # ls-files does not descend into submodules, so walk each one separately
+        # (when the target is a subdirectory, foreach also lists submodules outside it as ../...)
+        git -C "$project_path" submodule --quiet foreach --recursive 'printf "%s\0" "$displaypath"' 2>/dev/null |
+            while IFS= read -r -d '' submodule; do
+                case "$submodule" in
+                    ../*) continue ;;
+                esac
+                git -C "$project_path/$submodule" -c core.quotePath=false ls-files -z --cached --others --exclude-standard \
+                    -- "${pathspecs[@]}" 2>/dev/null |
+                    while IFS= read -r -d '' marker; do
+                        printf '%s\0' "$submodule/$marker"
+                    done
+            done || true
     else
+        (cd "$project_path" && find . \
+            \( -name .git -o -name node_modules -o -name vendor -o -name target \
+               -o -name .venv -o -name venv -o -name dist -o -name build \) -prune \
+            -o -type f \( "${find_names[@]}" \) -print0 2>/dev/null) |
+            while IFS= read -r -d '' marker; do
+                printf '%s\0' "${marker#./}"
+            done || true
+    fi
+}
+
+# List every sub-project as "<relative dir>\t<stack>"
+# Directories whose path contains a tab or newline are skipped (not representable in this format)
+list_project_stacks() {
+    local project_path="$1"
+    local marker dir
+
+    list_marker_files "$project_path" | while IFS= read -r -d '' marker; do
+        case "$marker" in
+            *$'\t'*|*$'\n'*) continue ;;
+        esac
+        # --cached also lists tracked markers deleted from the working tree
+        [ -f "$project_path/$marker" ] || continue
+        if [[ "$marker" == */* ]]; then
+            dir="${marker%/*}"
+        else
+            dir="."
+        fi
+        printf '%s\t%s\n' "$dir" "$(marker_stack "${marker##*/}")"
+    done | sort -u
+}
+
+# Count distinct sub-project directories in list_project_stacks output
+count_subprojects() {
+    local project_stacks="$1"
+
+    if [ -z "$project_stacks" ]; then
+        echo 0
+        return
+    fi
+
+    printf '%s\n' "$project_stacks" | cut -f1 | sort -u | wc -l | tr -d ' '
+}
+
+# Summarize list_project_stacks output (e.g. "Node.js/JavaScript + Python")
+format_project_type() {
+    local project_stacks="$1"
+    local stacks count
+
+    if [ -z "$project_stacks" ]; then
         echo "Generic"
+        return
     fi
+
+    stacks=$(printf '%s\n' "$project_stacks" | cut -f2 | sort -u | paste -sd '+' - | sed 's/+/ + /g')
+    count=$(count_subprojects "$project_stacks")
+
+    if [ "$count" -gt 1 ]; then
+        echo "$stacks (monorepo: $count sub-projects)"
+    else
+        echo "$stacks"
+    fi
+}
+
+# Detect project type (all stacks found across sub-projects)
+detect_project_type() {
+    format_project_type "$(list_project_stacks "$1")"
 }
 
 # Get project name from path or config
@@ -127,6 +218,7 @@ install_mini_coderbrain() {
     local target_path="$1"
     local project_name
     local project_type
+    local project_stacks
 
     print_header
 
@@ -150,10 +242,16 @@ install_mini_coderbrain() {
 
     # Detect project info
     project_name=$(get_project_name "$target_path")
-    project_type=$(detect_project_type "$target_path")
+    project_stacks=$(list_project_stacks "$target_path")
+    project_type=$(format_project_type "$project_stacks")
 
     print_info "Project: $project_name"
     print_info "Type: $project_type"
+    if [ "$(count_subprojects "$project_stacks")" -gt 1 ]; then
+        printf '%s\n' "$project_stacks" | while IFS=$'\t' read -r dir stack; do
+            echo "     • $dir ($stack)"
+        done
+    fi
     print_info "Target: $target_path"
     echo ""
 
@@ -390,5 +488,7 @@ main() {
     install_mini_coderbrain "$target_path"
 }
 
-# Run main function
-main "$@"
+# Run main function (skipped when sourced, e.g. by scripts/bench-project-detection.sh)
+if [ "${BASH_SOURCE[0]:-$0}" = "$0" ]; then
+    main "$@"
+fi
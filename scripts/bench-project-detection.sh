@@ -0,0 +1,105 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Mini-CoderBrain - Project Detection Benchmark
+# Times detect_project_type() from install.sh on synthetic trees
+#
+# Usage: ./scripts/bench-project-detection.sh [file counts...]   (default: 10000 100000)
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# shellcheck source=../install.sh
+source "$SCRIPT_DIR/../install.sh"
+
+WORK_DIR="$(mktemp -d "${TMPDIR:-/tmp}/mcb-bench.XXXXXX")"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Build a tree of N empty files across 50x200 directories, plus 3 sub-projects
+# and an ignored node_modules package that must not be reported
+build_tree() {
+    local tree="$1"
+    local files="$2"
+    local i
+
+    mkdir -p "$tree"
+
+    for ((i = 0; i < files; i++)); do
+        printf '%s\n' "pkg$((i % 50))/sub$((i % 200))"
+    done | sort -u | (cd "$tree" && xargs mkdir -p)
+
+    for ((i = 0; i < files; i++)); do
+        printf '%s\n' "pkg$((i % 50))/sub$((i % 200))/f$i.txt"
+    done | (cd "$tree" && xargs touch)
+
+    mkdir -p "$tree/web" "$tree/api" "$tree/cli" "$tree/web/node_modules/dep"
+    touch "$tree/web/package.json" "$tree/api/requirements.txt" "$tree/api/setup.py" \
+        "$tree/cli/Cargo.toml" "$tree/web/node_modules/dep/package.json"
+    echo "node_modules/" > "$tree/.gitignore"
+}
+
+# Print "<label>  <seconds>  <detected type>" for one detection run
+time_detection() {
+    local label="$1"
+    local tree="$2"
+    local TIMEFORMAT='%R'
+
+    { time detect_project_type "$tree" > "$WORK_DIR/detected" ; } 2> "$WORK_DIR/seconds"
+    printf '  %-12s %8ss   %s\n' "$label" "$(cat "$WORK_DIR/seconds")" "$(cat "$WORK_DIR/detected")"
+}
+
+# Check that a target inside a larger repo ignores submodules outside it
+check_subdirectory_target() {
+    local repo="$WORK_DIR/subdir-repo"
+    local expected="Python"
+    local detected
+    local git_cmd=(git -c user.name=bench -c user.email=bench@localhost -c protocol.file.allow=always)
+
+    mkdir -p "$repo/sub/lib" "$repo/main/café"
+    touch "$repo/sub/Cargo.toml" "$repo/sub/lib/go.mod" "$repo/main/café/pyproject.toml"
+    "${git_cmd[@]}" -C "$repo/sub" init -q
+    "${git_cmd[@]}" -C "$repo/sub" add -A
+    "${git_cmd[@]}" -C "$repo/sub" commit -qm "sub"
+    "${git_cmd[@]}" -C "$repo/main" init -q
+    "${git_cmd[@]}" -C "$repo/main" submodule add -q "$repo/sub" mods/sub >/dev/null 2>&1
+    "${git_cmd[@]}" -C "$repo/main" add -A
+    "${git_cmd[@]}" -C "$repo/main" commit -qm "main"
+
+    detected=$(detect_project_type "$repo/main/café")
+    echo ""
+    if [ "$detected" = "$expected" ]; then
+        echo "Subdirectory target: ok ($detected)"
+    else
+        echo "Subdirectory target: FAILED (expected \"$expected\", got \"$detected\")"
+        return 1
+    fi
+}
+
+main() {
+    local sizes=("$@")
+    local files tree
+
+    if [ ${#sizes[@]} -eq 0 ]; then
+        sizes=(10000 100000)
+    fi
+
+    echo "Project detection benchmark (detect_project_type)"
+    for files in "${sizes[@]}"; do
+        tree="$WORK_DIR/tree-$files"
+        build_tree "$tree" "$files"
+
+        echo ""
+        echo "$files files:"
+        time_detection "find" "$tree"
+
+        if command -v git >/dev/null 2>&1; then
+            git -C "$tree" init -q
+            git -C "$tree" add -A
+            time_detection "git ls-files" "$tree"
+        fi
+    done
+
+    if command -v git >/dev/null 2>&1; then
+        check_subdirectory_target
+    fi
+}
+
+main "$@"